@@ -36,6 +36,8 @@ class FileStat(abc.ABC):
             sizes depending on the filesystem or container type.
 
     """     # NOQA
+    __slots__ = ()
+
     filename = None
     last_modified = None
     mode = None
@@ -103,9 +105,10 @@ class FS(abc.ABC):
                  [str, int], Any]] = None) -> Type["IOBase"]:
         raise NotImplementedError()
 
-    def open_zip(self, file_path: str, mode='r') -> Type["Zip"]:  # NOQA
+    def open_zip(self, file_path: str, mode='r',
+                 **kwargs) -> Type["Zip"]:  # NOQA
         from .zip import Zip
-        return Zip(self, file_path, mode)
+        return Zip(self, file_path, mode, **kwargs)
 
     def subfs(self, rel_path: str) -> Type["FS"]:
         '''Virtually changes the working directory
@@ -126,8 +129,10 @@ class FS(abc.ABC):
         sub._cwd = os.path.join(self.cwd, rel_path)
         return sub
 
-    def _checkfork(self):
-        if self.is_forked:
+    def _checkfork(self, getpid=os.getpid):
+        # Called at the top of every operation; compares the pid
+        # directly instead of going through ``is_forked``
+        if self.pid != getpid():
             raise ForkedError()
 
     @property
@@ -29,16 +29,19 @@ class LocalFileStat(FileStat):
     """
 
     def __init__(self, _stat, filename):
-        keys = (('last_modified', 'st_mtime'),
-                ('last_accessed', 'st_atime'),
-                ('last_modified_ns', 'st_mtime_ns'),
-                ('last_accessed_ns', 'st_atime_ns'),
-                ('created', 'st_ctime'), ('created_ns', 'st_ctime_ns'),
-                ('mode', 'st_mode'), ('size', 'st_size'), ('uid', 'st_uid'),
-                ('gid', 'st_gid'), ('ino', 'st_ino'), ('dev', 'st_dev'),
-                ('nlink', 'st_nlink'))
-        for k, ksrc in keys:
-            setattr(self, k, getattr(_stat, ksrc))
+        self.last_modified = _stat.st_mtime
+        self.last_accessed = _stat.st_atime
+        self.last_modified_ns = _stat.st_mtime_ns
+        self.last_accessed_ns = _stat.st_atime_ns
+        self.created = _stat.st_ctime
+        self.created_ns = _stat.st_ctime_ns
+        self.mode = _stat.st_mode
+        self.size = _stat.st_size
+        self.uid = _stat.st_uid
+        self.gid = _stat.st_gid
+        self.ino = _stat.st_ino
+        self.dev = _stat.st_dev
+        self.nlink = _stat.st_nlink
         self.filename = filename
 
 
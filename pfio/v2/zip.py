@@ -1,16 +1,232 @@
+import bisect
+import functools
 import io
+import itertools
 import logging
 import os
-import sys
-import warnings
+import struct
+import time
 import zipfile
-from datetime import datetime
 
 from .fs import FS, FileStat
 
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.StreamHandler())
 
+# https://pkware.cachefly.net/webdocs/casestudies/APPNOTE.TXT
+_END_OF_CENTRAL_DIR = struct.Struct('<4s4H2LH')
+_CENTRAL_DIR = struct.Struct('<4s4B4HL2L5H2L')
+# The end of central directory record may be followed by a comment
+# of up to 64KiB
+_MAX_TAIL_SIZE = _END_OF_CENTRAL_DIR.size + 0xFFFF
+_EXTRA_HEADER = struct.Struct('<2H')
+# Extra fields interpreted by ZipInfo._decodeExtra: ZIP64 and, since
+# Python 3.12, Info-ZIP Unicode Path
+_DECODED_EXTRA_IDS = (0x0001, 0x7075)
+# Recent Python versions check entries against the start of the next
+# one to reject overlapping entries (possible zip bombs)
+_HAS_END_OFFSET = '_end_offset' in zipfile.ZipInfo.__slots__
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize(cwd, path):
+    # Same paths are resolved over and over, e.g. exists() and open()
+    # of each entry in dataset loaders
+    return os.path.join(cwd, os.path.normpath(path))
+
+
+class _TailCachedFile(io.RawIOBase):
+    """Seekable read-only file that serves reads near the end from memory
+
+    Opening a zip reads the end of central directory record, the ZIP64
+    locator and often the central directory itself, all placed at the
+    end of the file. Fetching them with a single read saves round trips
+    on remote backends such as S3.
+    """
+
+    def __init__(self, fileobj):
+        super().__init__()
+        self._fileobj = fileobj
+        fileobj.seek(0, io.SEEK_END)
+        self._size = fileobj.tell()
+        self._tail_start = max(self._size - _MAX_TAIL_SIZE, 0)
+        fileobj.seek(self._tail_start)
+        self._tail = fileobj.read()
+        self._pos = 0
+
+    def read(self, size=-1):
+        self._checkClosed()
+        if self._pos >= self._tail_start:
+            start = self._pos - self._tail_start
+            if size is None or size < 0:
+                data = self._tail[start:]
+            else:
+                data = self._tail[start:start + size]
+        else:
+            self._fileobj.seek(self._pos)
+            data = self._fileobj.read(size)
+        self._pos += len(data)
+        return data
+
+    def readall(self):
+        return self.read()
+
+    def readinto(self, b):
+        data = self.read(len(b))
+        n = len(data)
+        b[:n] = data
+        return n
+
+    def seek(self, pos, whence=io.SEEK_SET):
+        self._checkClosed()
+        if whence == io.SEEK_CUR:
+            pos += self._pos
+        elif whence == io.SEEK_END:
+            pos += self._size
+        elif whence != io.SEEK_SET:
+            raise ValueError('Wrong whence value: {}'.format(whence))
+
+        if pos < 0:
+            raise OSError(22, "[Errno 22] Invalid argument")
+        self._pos = pos
+        return self._pos
+
+    def tell(self):
+        self._checkClosed()
+        return self._pos
+
+    def seekable(self):
+        return True
+
+    def readable(self):
+        return True
+
+    def close(self):
+        self._tail = b''
+        try:
+            self._fileobj.close()
+        finally:
+            super().close()
+
+
+def _scan_central_directory(fileobj):
+    """Reads the central directory without building ``ZipInfo`` objects
+
+    Returns:
+        A list of pairs of each name, in the order of the central
+        directory including duplicated names, and a tuple of the fixed
+        fields of its central directory record, the name as stored, the
+        extra field, the comment, the header offset and the offset
+        where the entry ends. ``None`` for ZIP64 or multi-disk
+        archives, unsupported zip versions and extra fields that change
+        the entry, which are left to the ``zipfile`` module.
+    """
+    fileobj.seek(0, io.SEEK_END)
+    start = max(fileobj.tell() - _MAX_TAIL_SIZE, 0)
+    fileobj.seek(start)
+    tail = fileobj.read()
+
+    pos = tail.rfind(b'PK\x05\x06')
+    if pos < 0 or pos + _END_OF_CENTRAL_DIR.size > len(tail):
+        raise zipfile.BadZipFile("File is not a zip file")
+
+    (_, disk, cd_disk, _, count, cd_size, cd_offset,
+     _) = _END_OF_CENTRAL_DIR.unpack_from(tail, pos)
+    if (disk or cd_disk or count == 0xFFFF
+            or cd_size == 0xFFFFFFFF or cd_offset == 0xFFFFFFFF
+            or tail[max(pos - 20, 0):pos - 16] == b'PK\x06\x07'):
+        return None
+
+    # Non-zero when the zip is concatenated to another file
+    concat = start + pos - cd_size - cd_offset
+    if concat < 0:
+        raise zipfile.BadZipFile("Bad offset for central directory")
+
+    cd_start = cd_offset + concat
+    if cd_start >= start:
+        buf = tail[cd_start - start:cd_start - start + cd_size]
+    else:
+        fileobj.seek(cd_start)
+        buf = fileobj.read(cd_size)
+
+    entries = []
+    offset = 0
+    while offset < cd_size:
+        if offset + _CENTRAL_DIR.size > len(buf):
+            raise zipfile.BadZipFile("Truncated central directory")
+        fields = _CENTRAL_DIR.unpack_from(buf, offset)
+        if fields[0] != b'PK\x01\x02':
+            raise zipfile.BadZipFile(
+                "Bad magic number for central directory")
+        if (0xFFFFFFFF in (fields[10], fields[11], fields[18])
+                or fields[3] > zipfile.MAX_EXTRACT_VERSION):
+            return None
+
+        offset += _CENTRAL_DIR.size
+        name_end = offset + fields[12]
+        extra_end = name_end + fields[13]
+        comment_end = extra_end + fields[14]
+
+        extra = buf[name_end:extra_end]
+        extra_pos = 0
+        while extra_pos + _EXTRA_HEADER.size <= len(extra):
+            tag, size = _EXTRA_HEADER.unpack_from(extra, extra_pos)
+            if tag in _DECODED_EXTRA_IDS:
+                return None
+            extra_pos += _EXTRA_HEADER.size + size
+
+        orig_name = buf[offset:name_end]
+        if fields[5] & 0x800:
+            orig_name = orig_name.decode('utf-8')
+        else:
+            orig_name = orig_name.decode('cp437')
+        # Same as zipfile.ZipInfo
+        null_byte = orig_name.find(chr(0))
+        name = orig_name[:null_byte] if null_byte >= 0 else orig_name
+
+        entries.append((name, (fields, orig_name, extra,
+                               buf[extra_end:comment_end],
+                               fields[18] + concat)))
+        offset = comment_end
+
+    # Same as ZipFile._RealGetContents, including duplicated names
+    end_offsets = [None] * len(entries)
+    end_offset = cd_start
+    for i in sorted(range(len(entries)), key=lambda i: entries[i][1][4],
+                    reverse=True):
+        end_offsets[i] = end_offset
+        end_offset = entries[i][1][4]
+
+    return [(name, record + (end_offset,))
+            for (name, record), end_offset in zip(entries, end_offsets)]
+
+
+def _make_zipinfo(record):
+    # Mirrors ZipFile._RealGetContents for a single entry
+    fields, orig_name, extra, comment, header_offset, end_offset = record
+    info = zipfile.ZipInfo(orig_name)
+    info.extra = extra
+    info.comment = comment
+    info.header_offset = header_offset
+    (info.create_version, info.create_system, info.extract_version,
+     info.reserved, info.flag_bits, info.compress_type, t, d,
+     info.CRC, info.compress_size, info.file_size) = fields[1:12]
+    info.volume, info.internal_attr, info.external_attr = fields[15:18]
+    info._raw_time = t
+    if _HAS_END_OFFSET:
+        info._end_offset = end_offset
+    info.date_time = ((d >> 9) + 1980, (d >> 5) & 0xF, d & 0x1F,
+                      t >> 11, (t >> 5) & 0x3F, (t & 0x1F) * 2)
+    return info
+
+
+class _EntryReader(zipfile.ZipFile):
+    # Opens entries from ZipInfo built out of the scanned central
+    # directory, skipping zipfile's own scan of it. ``namelist()`` and
+    # other lookups by name are empty and must not be used.
+    def _RealGetContents(self):
+        pass
+
 
 class ZipFileStat(FileStat):
     """Detailed information of a file in a Zip
@@ -36,23 +252,81 @@ class ZipFileStat(FileStat):
         CRC (int): ``ZipFile.CRC``.
     """
 
+    __slots__ = ('filename', 'orig_filename', 'comment', 'mode', 'size',
+                 'create_system', 'create_version', 'extract_version',
+                 'flag_bits', 'volume', 'internal_attr', 'external_attr',
+                 'CRC', 'header_offset', 'compress_size', 'compress_type',
+                 '_date_time', '_last_modified')
+
     def __init__(self, zip_info):
-        self.last_modified = float(datetime(*zip_info.date_time).timestamp())
         # https://github.com/python/cpython/blob/3.8/Lib/zipfile.py#L392
         self.mode = zip_info.external_attr >> 16
         self.size = zip_info.file_size
 
-        for k in ('filename', 'orig_filename', 'comment', 'create_system',
-                  'create_version', 'extract_version', 'flag_bits',
-                  'volume', 'internal_attr', 'external_attr', 'CRC',
-                  'header_offset', 'compress_size', 'compress_type'):
-            setattr(self, k, getattr(zip_info, k))
+        self.filename = zip_info.filename
+        self.orig_filename = zip_info.orig_filename
+        self.comment = zip_info.comment
+        self.create_system = zip_info.create_system
+        self.create_version = zip_info.create_version
+        self.extract_version = zip_info.extract_version
+        self.flag_bits = zip_info.flag_bits
+        self.volume = zip_info.volume
+        self.internal_attr = zip_info.internal_attr
+        self.external_attr = zip_info.external_attr
+        self.CRC = zip_info.CRC
+        self.header_offset = zip_info.header_offset
+        self.compress_size = zip_info.compress_size
+        self.compress_type = zip_info.compress_type
+
+        self._date_time = zip_info.date_time
+        self._last_modified = None
+
+    @property
+    def last_modified(self):
+        # Converted on demand as most callers only need the size
+        if self._last_modified is None:
+            # Same as datetime(*date_time).timestamp(), i.e. local
+            # time, without building a datetime object
+            self._last_modified = time.mktime(
+                self._date_time + (0, 0, -1))
+        return self._last_modified
+
+    def __getstate__(self):
+        # Slots leave no __dict__ for pickle protocols 0 and 1
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __setstate__(self, state):
+        for k, v in state.items():
+            setattr(self, k, v)
+
+    def isdir(self):
+        """Returns whether the target is a directory
+
+        As in ``ZipInfo.is_dir()``, a name ending with a slash is a
+        directory even without the permission flag, which tools on DOS
+        and Windows do not set.
+
+        Returns:
+            `True` if directory, `False` otherwise.
+        """
+        return self.filename.endswith('/') or super().isdir()
 
 
 class Zip(FS):
+    '''Zip archive wrapper
+
+    With ``metadata_only=True`` in read mode, only the central
+    directory fields needed for listing and stats are parsed upon
+    open, instead of building ``zipfile.ZipInfo`` for every entry.
+    This makes opening archives with many entries faster. Entries are
+    opened with ``ZipInfo`` built from the scanned fields, so the
+    archive is never parsed again by ``zipfile`` unless ``zipobj`` is
+    accessed. ZIP64 archives are always read with ``zipfile``.
+    '''
     _readonly = True
 
-    def __init__(self, backend, file_path, mode='r', create=False, **_):
+    def __init__(self, backend, file_path, mode='r', create=False,
+                 metadata_only=False, **_):
         super().__init__()
         self.backend = backend
         self.file_path = file_path
@@ -69,38 +343,109 @@ class Zip(FS):
 
         self.fileobj = self.backend.open(file_path, mode + 'b')
 
-        if isinstance(self.backend, Zip) \
-           and sys.version_info < (3, 7, ):
-            # In Python < 3.7, the returned file object from zipfile.open,
-            # i.e. ZipExtFile, is not seekable,
-            # while in order to open as zip, the zipfile module requires
-            # the given file object to be seekable, which makes
-            # nested zip impossible.
-            # As a workaround, in case of nested zip,  we read the
-            # whole nested zipfile into BytesIO object,
-            # which is a seekable file object, upon open.
-            # However, it might cause performance and memory
-            # issues when the zipfile is huge. A warning is generated
-            # for user.
-
-            warnings.warn('In Python < 3.7, '
-                          'To support opening nested zip as container, '
-                          'PFIO has to read '
-                          'the entire nested zip upon open, '
-                          'which might cause performance or '
-                          'memory issues when the nested zip is huge.',
-                          category=RuntimeWarning)
-            self.fileobj = io.BytesIO(self.fileobj.read())
-
-        self.zipobj = zipfile.ZipFile(self.fileobj, mode)
+        # Reading zip requires random access; this also applies to
+        # nested zip, where the file object is a ZipExtFile
+        if mode == 'r':
+            if not self.fileobj.seekable():
+                self.fileobj.close()
+                raise RuntimeError(
+                    "{} is not seekable and cannot be opened as zip".format(
+                        file_path))
+            self.fileobj = _TailCachedFile(self.fileobj)
+
+        self._zipobj = None
+        self._reader = None
+        self._records = None
+        entries = None
+        if metadata_only and mode == 'r':
+            entries = _scan_central_directory(self.fileobj)
+        if entries is None:
+            self._zipobj = zipfile.ZipFile(self.fileobj, mode)
+        else:
+            # Duplicated names are kept as in ZipFile.namelist(), while
+            # the last one wins in lookups as in ZipFile.getinfo()
+            self._record_names = [name for name, _ in entries]
+            self._records = dict(entries)
+        self._build_index()
+
+    @property
+    def zipobj(self):
+        # In metadata_only mode, only created when explicitly accessed
+        if self._zipobj is None:
+            self._zipobj = zipfile.ZipFile(self.fileobj, self.mode)
+        return self._zipobj
+
+    def _getinfo(self, name):
+        if self._records is not None:
+            try:
+                return _make_zipinfo(self._records[name])
+            except KeyError:
+                raise KeyError(
+                    'There is no item named %r in the archive' % name)
+        return self.zipobj.getinfo(name)
+
+    def _open_entry(self, name):
+        if self._records is None:
+            return self.zipobj.open(name)
+
+        if self._reader is None:
+            self._reader = _EntryReader(self.fileobj)
+        return self._reader.open(self._getinfo(name))
+
+    def _build_index(self):
+        # ZipFile.namelist() builds a new list on every call, so
+        # keep the names around for lookups
+        if self._records is not None:
+            names = self._record_names
+        else:
+            names = self.zipobj.namelist()
+
+        # All the directories including the implicit ones, which are
+        # not stored in zips made with "zip -D", and a map from each
+        # directory to its immediate children; the root is ``""``
+        dirs = set()
+        children = {}
+        # Bound to locals as this runs for every entry upon open
+        normpath = os.path.normpath
+        add_dir = dirs.add
+        setdefault = children.setdefault
+        for name in names:
+            path = normpath(name)
+            if name.endswith('/'):
+                add_dir(path)
+
+            parent = ""
+            for part in path.split('/'):
+                setdefault(parent, set()).add(part)
+                parent = parent + '/' + part if parent else part
+        dirs.update(children)
+        dirs.discard("")
+
+        self._names = names
+        self._nameset = frozenset(names)
+        self._sorted_names = sorted(names)
+        self._dirs = frozenset(dirs)
+        self._children = {k: tuple(sorted(v)) for k, v in children.items()}
+
+    def _check_index(self):
+        # Entries are only appended in writable modes, hence a count
+        # mismatch means the index is stale
+        if self.mode != 'r' and \
+           len(self._names) != len(self.zipobj.filelist):
+            self._build_index()
 
     def open(self, file_path, mode='r',
              buffering=-1, encoding=None, errors=None,
              newline=None, closefd=True, opener=None):
         self._checkfork()
 
-        file_path = os.path.join(self.cwd, os.path.normpath(file_path))
-        fp = self.zipobj.open(file_path, mode.replace('b', ''))
+        file_path = _normalize(self.cwd, file_path)
+        zip_mode = mode.replace('b', '')
+        if zip_mode == 'r':
+            fp = self._open_entry(file_path)
+        else:
+            # zipfile validates the mode
+            fp = self.zipobj.open(file_path, zip_mode)
 
         if 'b' not in mode:
             fp = io.TextIOWrapper(fp, encoding, errors, newline)
@@ -113,16 +458,21 @@ class Zip(FS):
 
     def close(self):
         self._checkfork()
-        self.zipobj.close()
-        self.fileobj.close()
+        try:
+            for zipobj in (self._reader, self._zipobj):
+                if zipobj is not None:
+                    zipobj.close()
+        finally:
+            self.fileobj.close()
 
     def stat(self, path):
         self._checkfork()
-        path = os.path.join(self.cwd, os.path.normpath(path))
-        if path in self.zipobj.namelist():
+        self._check_index()
+        path = _normalize(self.cwd, path)
+        if path in self._nameset:
             actual_path = path
         elif (not path.endswith('/')
-              and path + '/' in self.zipobj.namelist()):
+              and path + '/' in self._nameset):
             # handles cases when path is a directory but without trailing slash
             # see issue $67
             actual_path = path + '/'
@@ -130,74 +480,71 @@ class Zip(FS):
             raise FileNotFoundError(
                 "{} is not found".format(path))
 
-        return ZipFileStat(self.zipobj.getinfo(actual_path))
+        return ZipFileStat(self._getinfo(actual_path))
+
+    def stat_all(self):
+        """Show details of all the files and directories in the zip
+
+        Unlike calling :meth:`stat` for each name, this walks the
+        entries only once without path normalization and lookups.
+
+        Returns:
+            A dict that maps each name in the zip to its
+            :class:`ZipFileStat` object.
+        """
+        self._checkfork()
+        if self._records is not None:
+            return {name: ZipFileStat(_make_zipinfo(record))
+                    for name, record in self._records.items()}
+        return {info.filename: ZipFileStat(info)
+                for info in self.zipobj.infolist()}
 
     def list(self, path_or_prefix: str = "", recursive=False):
         self._checkfork()
+        self._check_index()
 
         if path_or_prefix:
-            path_or_prefix = os.path.join(self.cwd,
-                                          os.path.normpath(path_or_prefix))
+            path_or_prefix = _normalize(self.cwd, path_or_prefix)
             # cannot move beyond root
             given_dir_list = path_or_prefix.split('/')
             if ("." in given_dir_list or ".." in given_dir_list
-                    or {""} == set(given_dir_list)):
-                given_dir_list = []
+                    or not any(given_dir_list)):
                 path_or_prefix = ""
-        else:
-            given_dir_list = []
 
         if path_or_prefix:
             if self.exists(path_or_prefix) and not self.isdir(path_or_prefix):
                 raise NotADirectoryError(
                     "{} is not a directory".format(path_or_prefix))
-            elif not any(name.startswith(path_or_prefix + "/")
-                         for name in self.zipobj.namelist()):
+            elif path_or_prefix not in self._dirs:
                 # check if directories are NOT included in the zip
                 # such kind of zip can be made with "zip -D"
                 raise FileNotFoundError(
                     "{} is not found".format(path_or_prefix))
 
         if recursive:
-            for name in self.zipobj.namelist():
-                if name.startswith(path_or_prefix):
-                    name = name[len(path_or_prefix):].strip("/")
-                    if name:
-                        yield name
+            # Names under the prefix are contiguous in the sorted list
+            names = self._sorted_names
+            start = bisect.bisect_left(names, path_or_prefix)
+            prefix_len = len(path_or_prefix)
+            for name in itertools.islice(names, start, None):
+                if not name.startswith(path_or_prefix):
+                    break
+                name = name[prefix_len:].strip("/")
+                if name:
+                    yield name
         else:
-            _list = set()
-            for name in self.zipobj.namelist():
-                return_file_name = None
-                current_dir_list = os.path.normpath(name).split('/')
-                if not given_dir_list:
-                    # if path_or_prefix is not given
-                    return_file_name = current_dir_list[0]
-                else:
-                    if (current_dir_list
-                            and len(current_dir_list) > len(given_dir_list)
-                            and current_dir_list[:len(given_dir_list)] ==
-                            given_dir_list):
-                        return_file_name = current_dir_list[
-                            len(given_dir_list):][0]
-
-                if (return_file_name is not None
-                        and return_file_name not in _list):
-                    _list.add(return_file_name)
-                    yield return_file_name
+            yield from self._children.get(path_or_prefix, ())
 
     def isdir(self, file_path: str):
         self._checkfork()
-        file_path = os.path.join(self.cwd, file_path)
-        if self.exists(file_path):
-            return self.stat(file_path).isdir()
-        else:
-            file_path = os.path.normpath(file_path)
-            # check if directories are NOT included in the zip
-            if any(name.startswith(file_path + "/")
-                   for name in self.zipobj.namelist()):
-                return True
+        self._check_index()
+        file_path = _normalize(self.cwd, file_path)
+        if file_path in self._dirs:
+            return True
+        elif file_path in self._nameset:
+            return ZipFileStat(self._getinfo(file_path)).isdir()
 
-            return False
+        return False
 
     def mkdir(self, file_path: str, mode=0o777, *args, dir_fd=None):
         raise io.UnsupportedOperation("zip does not support mkdir")
@@ -207,10 +554,10 @@ class Zip(FS):
 
     def exists(self, file_path: str):
         self._checkfork()
-        file_path = os.path.join(self.cwd, os.path.normpath(file_path))
-        namelist = self.zipobj.namelist()
-        return (file_path in namelist
-                or file_path + "/" in namelist)
+        self._check_index()
+        file_path = _normalize(self.cwd, file_path)
+        return (file_path in self._nameset
+                or file_path + "/" in self._nameset)
 
     def rename(self, *args):
         raise io.UnsupportedOperation
@@ -56,7 +56,7 @@ setup(
         'doc': ['sphinx', 'sphinx_rtd_theme'],
         'bench': ['numpy>=1.19.5', 'torch>=1.9.0', 'Pillow<=8.2.0'],
     },
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     # When updating install requires, docs/requirements.txt should be updated too
     install_requires=['pyarrow>=6.0.0', 'boto3', 'deprecation'],
     include_package_data=True,
@@ -150,13 +150,15 @@ def test_seekeable_read(target):
         with fs.open(filename, 'wb') as fp:
             fp.write(content)
 
-        print(content)
-        for i, c in enumerate(content):
-            with fs.open(filename, 'rb') as fp:
+        with fs.open(filename, 'rb') as fp:
+            # Backwards, so that every seek moves the position
+            for i in reversed(range(len(content))):
                 fp.seek(i)
-                s = fp.read()
-                print(c, s)
-                assert c == s[0]
+                assert content[i] == fp.read(1)[0]
+
+            for i in range(len(content)):
+                fp.seek(i)
+                assert content[i:] == fp.read()
 
 
 def test_recreate():
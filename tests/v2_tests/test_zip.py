@@ -3,12 +3,15 @@ import multiprocessing
 import os
 import pickle
 import shutil
+import struct
 import subprocess
 import sys
 import tempfile
 import unittest
 import zipfile
+import zlib
 from datetime import datetime
+from unittest import mock
 from zipfile import ZipFile
 
 import pytest
@@ -156,6 +159,47 @@ class TestZip(unittest.TestCase):
             # ZipFile raises KeyError while io module raises IOError
             self.assertRaises(KeyError, z.open, non_exist_file)
 
+    def test_reopen(self):
+        with local.open_zip(os.path.abspath(self.zip_file_path)) as z:
+            with z.open(self.zipped_file_path, "rb") as zipped_file:
+                self.assertEqual(self.test_string_b[:4], zipped_file.read(4))
+
+            with z.open(self.zipped_file_path, "rb") as f1:
+                # another file object while the first one is in use
+                with z.open(self.zipped_file_path, "rb") as f2:
+                    self.assertEqual(self.test_string_b, f2.read())
+                self.assertEqual(self.test_string_b, f1.read())
+
+            with z.open(self.zipped_file_path, "r") as zipped_file:
+                self.assertEqual([self.test_string], list(zipped_file))
+
+            self.assertTrue(zipped_file.closed)
+            with self.assertRaises(ValueError):
+                zipped_file.read()
+
+    @parameterized.expand([[False], [True]])
+    def test_open_mode(self, metadata_only):
+        with local.open_zip(self.zip_file_path,
+                            metadata_only=metadata_only) as z:
+            for mode in ("r", "rb"):
+                with z.open(self.zipped_file_path, mode) as zipped_file:
+                    self.assertIsInstance(zipped_file, io.IOBase)
+
+            for mode in ("a", "ab", "r+", "rb+", "x"):
+                with self.assertRaises(ValueError):
+                    z.open(self.zipped_file_path, mode)
+
+    @parameterized.expand([[False], [True]])
+    def test_read_after_close(self, metadata_only):
+        z = local.open_zip(self.zip_file_path, metadata_only=metadata_only)
+        zipped_file = z.open(self.zipped_file_path, "rb")
+        z.close()
+        # The entry lies in the tail of the zip kept in memory
+        with self.assertRaises(ValueError):
+            zipped_file.read()
+        with self.assertRaises(ValueError):
+            z.fileobj.seek(0)
+
     @parameterized.expand([
         # not normalized path
         ['././{}//../{}/{}'.format(ZIP_TEST_FILENAME_LIST["dir_name2"],
@@ -499,6 +543,230 @@ class TestZip(unittest.TestCase):
                       'header_offset', 'compress_size', 'compress_type'):
                 self.assertEqual(getattr(stat, k), getattr(expected, k))
 
+    def test_stat_all(self):
+        with local.open_zip(self.zip_file_path) as z:
+            stats = z.stat_all()
+            self.assertEqual(sorted(ZipFile(self.zip_file_path).namelist()),
+                             sorted(stats))
+
+            for name, stat in stats.items():
+                self.assertIsInstance(stat, ZipFileStat)
+                self.assertEqual(name, stat.filename)
+                self.assertEqual(z.stat(name).size, stat.size)
+                self.assertEqual(z.isdir(name), stat.isdir())
+
+    def test_stat_pickle(self):
+        with local.open_zip(self.zip_file_path) as z:
+            stat = z.stat(self.zipped_file_path)
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            restored = pickle.loads(pickle.dumps(stat, protocol))
+            self.assertIsInstance(restored, ZipFileStat)
+            for k in ZipFileStat.__slots__:
+                self.assertEqual(getattr(stat, k), getattr(restored, k))
+            self.assertEqual(stat.last_modified, restored.last_modified)
+            self.assertFalse(restored.isdir())
+
+    def test_metadata_only(self):
+        with local.open_zip(self.zip_file_path) as z, \
+                local.open_zip(self.zip_file_path, metadata_only=True) as mz:
+            self.assertIsNone(mz._zipobj)
+
+            for recursive in (False, True):
+                self.assertEqual(sorted(z.list(recursive=recursive)),
+                                 sorted(mz.list(recursive=recursive)))
+
+            stats = z.stat_all()
+            mstats = mz.stat_all()
+            self.assertEqual(sorted(stats), sorted(mstats))
+            for name, stat in stats.items():
+                mstat = mstats[name]
+                for k in ('filename', 'orig_filename', 'comment',
+                          'last_modified', 'mode', 'size', 'create_system',
+                          'create_version', 'extract_version', 'flag_bits',
+                          'volume', 'internal_attr', 'external_attr', 'CRC',
+                          'header_offset', 'compress_size', 'compress_type'):
+                    self.assertEqual(getattr(stat, k), getattr(mstat, k))
+                self.assertEqual(z.isdir(name), mz.isdir(name))
+
+            with mz.open(self.zipped_file_path, "rb") as zipped_file:
+                self.assertEqual(self.test_string_b, zipped_file.read())
+            with mz.open(self.zipped_file_path, "r") as zipped_file:
+                self.assertEqual(self.test_string, zipped_file.read())
+            with self.assertRaises(KeyError):
+                mz.open("non_exist_file.txt")
+            self.assertIsNone(mz._zipobj)
+
+            with mz.open_zip(self.nested_zip_path,
+                             metadata_only=True) as nested_zip:
+                self.assertTrue(nested_zip.isdir(self.nested_dir_name))
+                with nested_zip.open(self.nested_zipped_file_path) as f:
+                    self.assertEqual(f.read(), self.nested_test_string)
+
+        dup_zip = "dup.zip"
+        with ZipFile(dup_zip, "w") as z, self.assertWarns(UserWarning):
+            z.writestr("dup", b"first")
+            z.writestr("dup", b"second")
+        try:
+            with local.open_zip(dup_zip) as z, \
+                    local.open_zip(dup_zip, metadata_only=True) as mz:
+                self.assertEqual(["dup", "dup"], list(z.list(recursive=True)))
+                for recursive in (False, True):
+                    self.assertEqual(list(z.list(recursive=recursive)),
+                                     list(mz.list(recursive=recursive)))
+                self.assertEqual(z.stat("dup").header_offset,
+                                 mz.stat("dup").header_offset)
+                with mz.open("dup", "rb") as f:
+                    self.assertEqual(b"second", f.read())
+        finally:
+            os.remove(dup_zip)
+
+    def test_metadata_only_unsupported_version(self):
+        version_zip = "version.zip"
+        with ZipFile(version_zip, "w") as z:
+            z.writestr("testfile", self.test_string_b)
+        with open(version_zip, "rb") as f:
+            data = bytearray(f.read())
+        # extract_version of the central directory record
+        data[data.rfind(b"PK\x01\x02") + 6] = 99
+        with open(version_zip, "wb") as f:
+            f.write(data)
+
+        try:
+            for metadata_only in (False, True):
+                with self.assertRaises(NotImplementedError):
+                    local.open_zip(version_zip, metadata_only=metadata_only)
+        finally:
+            os.remove(version_zip)
+
+    @parameterized.expand([[False], [True]])
+    def test_directory_without_mode(self, metadata_only):
+        dos_zip = "dos.zip"
+        with ZipFile(dos_zip, "w") as z:
+            # Only the MS-DOS directory attribute, without S_IFDIR
+            info = zipfile.ZipInfo("d/")
+            info.external_attr = 0x10
+            z.writestr(info, b"")
+            z.writestr("f", self.test_string_b)
+
+        try:
+            with local.open_zip(dos_zip, metadata_only=metadata_only) as z:
+                for path in ("d", "d/"):
+                    self.assertTrue(z.isdir(path))
+                    self.assertTrue(z.stat(path).isdir())
+                self.assertEqual([], list(z.list("d")))
+                self.assertEqual(["d", "f"], sorted(z.list()))
+                self.assertFalse(z.stat("f").isdir())
+        finally:
+            os.remove(dos_zip)
+
+    def test_close_twice(self):
+        for metadata_only in (False, True):
+            z = local.open_zip(self.zip_file_path,
+                               metadata_only=metadata_only)
+            with z.open(self.zipped_file_path, "rb") as zipped_file:
+                zipped_file.read()
+            z.close()
+            z.close()
+            self.assertTrue(z.fileobj.closed)
+
+    def test_metadata_only_concatenated(self):
+        concat_zip = "concat.zip"
+        with open(concat_zip, "wb") as dst, \
+                open(self.zip_file_path, "rb") as src:
+            dst.write(b"prepended data")
+            dst.write(src.read())
+
+        try:
+            with local.open_zip(concat_zip, metadata_only=True) as z:
+                self.assertEqual(
+                    ZipFile(concat_zip).getinfo(
+                        self.zipped_file_path).header_offset,
+                    z.stat(self.zipped_file_path).header_offset)
+                with z.open(self.zipped_file_path, "rb") as zipped_file:
+                    self.assertEqual(self.test_string_b, zipped_file.read())
+        finally:
+            os.remove(concat_zip)
+
+    def test_metadata_only_names(self):
+        name_zip = "names.zip"
+        unicode_name = "\u00fcnicode.txt"
+        with ZipFile(name_zip, "w") as z:
+            info = zipfile.ZipInfo("unicode.txt")
+            # Info-ZIP Unicode Path, applied by zipfile on Python 3.12+
+            path = unicode_name.encode("utf-8")
+            info.extra = struct.pack(
+                "<2HBL", 0x7075, 5 + len(path), 1,
+                zlib.crc32(b"unicode.txt")) + path
+            z.writestr(info, self.test_string_b)
+            z.writestr("null_byte.txt", self.test_string_b)
+        with open(name_zip, "rb") as f:
+            data = f.read()
+        with open(name_zip, "wb") as f:
+            f.write(data.replace(b"null_byte", b"null\x00byte"))
+
+        try:
+            with local.open_zip(name_zip) as z, \
+                    local.open_zip(name_zip, metadata_only=True) as mz:
+                self.assertEqual(sorted(z.list(recursive=True)),
+                                 sorted(mz.list(recursive=True)))
+                stats = z.stat_all()
+                mstats = mz.stat_all()
+                self.assertEqual(sorted(stats), sorted(mstats))
+                for name, stat in stats.items():
+                    self.assertEqual(stat.orig_filename,
+                                     mstats[name].orig_filename)
+                    with mz.open(name, "rb") as f:
+                        self.assertEqual(self.test_string_b, f.read())
+        finally:
+            os.remove(name_zip)
+
+    def test_metadata_only_zipfile_internals(self):
+        # metadata_only mode builds ZipInfo without ZipFile's own
+        # parser, relying on these private details of zipfile
+        self.assertTrue(callable(
+            getattr(zipfile.ZipFile, "_RealGetContents", None)))
+        self.assertIn("_raw_time", zipfile.ZipInfo.__slots__)
+        if sys.version_info >= (3, 13):
+            self.assertIn("_end_offset", zipfile.ZipInfo.__slots__)
+
+        with local.open_zip(self.zip_file_path, metadata_only=True) as mz, \
+                ZipFile(self.zip_file_path) as z:
+            for info in z.infolist():
+                minfo = mz._getinfo(info.filename)
+                for k in zipfile.ZipInfo.__slots__:
+                    self.assertEqual(getattr(info, k, None),
+                                     getattr(minfo, k, None), k)
+
+    @unittest.skipUnless("_end_offset" in zipfile.ZipInfo.__slots__,
+                         "zipfile does not check overlapped entries")
+    def test_metadata_only_overlapped(self):
+        overlapped_zip = "overlapped.zip"
+        with ZipFile(overlapped_zip, "w") as z:
+            z.writestr("testfile", self.test_string_b)
+        with open(overlapped_zip, "rb") as f:
+            data = f.read()
+
+        # Another entry pointing at the same local header
+        eocd = data.rfind(b"PK\x05\x06")
+        (sig, disk, cd_disk, disk_count, count, cd_size, cd_offset,
+         comment_size) = struct.unpack_from("<4s4H2LH", data, eocd)
+        with open(overlapped_zip, "wb") as f:
+            f.write(data[:eocd])
+            f.write(data[cd_offset:eocd])
+            f.write(struct.pack("<4s4H2LH", sig, disk, cd_disk,
+                                disk_count + 1, count + 1, cd_size * 2,
+                                cd_offset, comment_size))
+
+        try:
+            for metadata_only in (False, True):
+                with local.open_zip(overlapped_zip,
+                                    metadata_only=metadata_only) as z:
+                    with self.assertRaisesRegex(zipfile.BadZipFile,
+                                                "Overlapped entries"):
+                        z.open("testfile")
+        finally:
+            os.remove(overlapped_zip)
+
     def test_writing_after_listing(self):
         testfile_name = "testfile3"
         test_string = "this is a written string\n"
@@ -510,6 +778,21 @@ class TestZip(unittest.TestCase):
             with z.open(testfile_name, "w") as zipped_file:
                 zipped_file.write(test_string)
 
+    def test_listing_after_writing(self):
+        testfile_name = "testfile3"
+        test_string = "this is a written string\n"
+
+        with local.open_zip(
+                os.path.abspath(self.zip_file_path), 'w') as z:
+            self.assertFalse(z.exists(testfile_name))
+
+            with z.open(testfile_name, "w") as zipped_file:
+                zipped_file.write(test_string)
+
+            self.assertTrue(z.exists(testfile_name))
+            self.assertEqual([testfile_name], list(z.list()))
+            self.assertEqual(len(test_string), z.stat(testfile_name).size)
+
     @pytest.mark.skipif(sys.version_info > (3, 5),
                         reason="requires python3.5 or lower")
     def test_mode_w_exception(self):
@@ -522,6 +805,15 @@ class TestZip(unittest.TestCase):
                 with z.open(testfile_name, "w") as zipped_file:
                     zipped_file.write(test_string)
 
+    def test_open_non_seekable(self):
+        backend = mock.MagicMock()
+        fileobj = backend.open.return_value
+        fileobj.seekable.return_value = False
+
+        with self.assertRaises(RuntimeError):
+            Zip(backend, self.zip_file_path)
+        fileobj.close.assert_called_once_with()
+
     def test_fs_factory(self):
         with from_url(os.path.abspath(self.zip_file_path)) as fs:
             assert isinstance(fs, Zip)
@@ -576,6 +868,37 @@ class TestZipWithLargeData(unittest.TestCase):
         self.tmpdir.cleanup()
         local.remove(self.zip_file_path)
 
+    def test_open_reads_tail_once(self):
+        with open(self.zip_file_path, "rb") as f:
+            fileobj = mock.MagicMock(wraps=f)
+            backend = mock.MagicMock()
+            backend.open.return_value = fileobj
+
+            with Zip(backend, self.zip_file_path) as z:
+                self.assertEqual(1, fileobj.read.call_count)
+                with z.open(self.testfile_name) as zipped_file:
+                    self.assertEqual(self.test_string, zipped_file.read())
+
+    def test_tail_cached_file(self):
+        with open(self.zip_file_path, "rb") as f:
+            data = f.read()
+
+        with local.open_zip(self.zip_file_path) as z:
+            fileobj = z.fileobj
+            self.assertIsInstance(fileobj, io.IOBase)
+            # The head is read from the backend, the end from the cache
+            for pos in (0, len(data) - 100):
+                fileobj.seek(pos)
+                buf = bytearray(10)
+                self.assertEqual(10, fileobj.readinto(buf))
+                self.assertEqual(data[pos:pos + 10], buf)
+                self.assertEqual(pos + 10, fileobj.tell())
+
+                fileobj.seek(pos)
+                end = data.find(b"\n", pos) + 1 or len(data)
+                self.assertEqual(data[pos:end], fileobj.readline())
+                self.assertEqual(end, fileobj.tell())
+
     def test_read_multi_processes(self):
         barrier = multiprocessing.Barrier(2)
         with local.open_zip(